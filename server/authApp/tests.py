@@ -1,3 +1,166 @@
+from django.contrib.auth import get_user_model
 from django.test import TestCase
+from django.urls import reverse
 
-# Create your tests here.
+from .forms import EmailAuthenticationForm, UserPasswordUpdateForm
+
+User = get_user_model()
+
+
+class CustomUserModelTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # No test in this class authenticates, so skip hashing entirely.
+        cls.user = User.objects.create_user(email='test@example.com', password=None, username='test_user')
+
+    def test_create_user_requires_email(self):
+        with self.assertRaises(ValueError):
+            User.objects.create_user(email='', password=None, username='no_email')
+
+    def test_email_is_username_field(self):
+        self.assertEqual(User.USERNAME_FIELD, 'email')
+
+    def test_readable_name_property(self):
+        self.assertEqual(self.user.readable_name, 'Test User')
+
+    def test_readable_name_with_multiple_underscores(self):
+        user = User.objects.create_user(email='many@example.com', password=None, username='first_middle_last')
+        self.assertEqual(user.readable_name, 'First Middle Last')
+
+
+class EmailAuthenticationFormTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email='test@example.com', password='testpass123', username='test_user')
+
+    def test_valid_credentials(self):
+        form = EmailAuthenticationForm(data={'username': 'test@example.com', 'password': 'testpass123'})
+        self.assertTrue(form.is_valid())
+
+    def test_unknown_email_is_rejected(self):
+        form = EmailAuthenticationForm(data={'username': 'missing@example.com', 'password': 'testpass123'})
+        self.assertFalse(form.is_valid())
+        self.assertIn('This email does not exist.', form.errors['username'])
+
+
+class UserPasswordUpdateFormTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email='test@example.com', password='testpass123', username='test_user')
+
+    def test_correct_current_password_is_valid(self):
+        form = UserPasswordUpdateForm(user=self.user, data={
+            'current_password': 'testpass123',
+            'new_password': 'newpass456',
+            'confirm_new_password': 'newpass456',
+        })
+        self.assertTrue(form.is_valid())
+
+    def test_wrong_current_password_is_rejected(self):
+        form = UserPasswordUpdateForm(user=self.user, data={
+            'current_password': 'wrongpass',
+            'new_password': 'newpass456',
+            'confirm_new_password': 'newpass456',
+        })
+        self.assertFalse(form.is_valid())
+
+    def test_mismatched_new_passwords_are_rejected(self):
+        form = UserPasswordUpdateForm(user=self.user, data={
+            'current_password': 'testpass123',
+            'new_password': 'newpass456',
+            'confirm_new_password': 'different789',
+        })
+        self.assertFalse(form.is_valid())
+
+    def test_save_updates_password(self):
+        form = UserPasswordUpdateForm(user=self.user, data={
+            'current_password': 'testpass123',
+            'new_password': 'newpass456',
+            'confirm_new_password': 'newpass456',
+        })
+        self.assertTrue(form.is_valid())
+        form.save()
+        self.assertTrue(self.user.check_password('newpass456'))
+
+
+class LoginViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email='test@example.com', password='testpass123', username='test_user')
+
+    def setUp(self):
+        self.login_url = reverse('login')
+        self.api_login_url = '/api/auth/users/login/'
+
+    def test_login_view_points_to_api(self):
+        response = self.client.get(self.login_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['endpoint'], '/api/auth/users/login/')
+
+    def test_login_api_post_valid_credentials(self):
+        # One SELECT to authenticate; JWT issuance touches no tables.
+        # Pins the login hot path so a later N+1 (e.g. a signal pulling
+        # in UserDetails) fails here rather than slipping into production.
+        with self.assertNumQueries(1):
+            response = self.client.post(
+                self.api_login_url,
+                {'email': 'test@example.com', 'password': 'testpass123'},
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('access', response.json()['tokens'])
+
+    def test_login_api_post_invalid_credentials(self):
+        response = self.client.post(
+            self.api_login_url,
+            {'email': 'test@example.com', 'password': 'wrongpass'},
+        )
+        self.assertEqual(response.status_code, 401)
+
+
+class RegisterViewTests(TestCase):
+    def setUp(self):
+        self.register_url = reverse('register')
+        self.api_register_url = '/api/auth/users/register/'
+
+    def test_register_view_points_to_api(self):
+        response = self.client.get(self.register_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['endpoint'], '/api/auth/users/register/')
+
+    def test_register_api_post_valid_data(self):
+        response = self.client.post(
+            self.api_register_url,
+            {'email': 'newuser@example.com', 'username': 'new_user', 'password': 'newpass456'},
+        )
+        self.assertEqual(response.status_code, 201)
+        # One joined SELECT checks both the user row and its UserDetails
+        # instead of a separate exists()/get()/exists() round-trip each.
+        user = User.objects.select_related('details').get(email='newuser@example.com')
+        self.assertIsNotNone(user.details.pk)
+
+    def test_register_api_post_duplicate_email(self):
+        User.objects.create_user(email='taken@example.com', password='testpass123', username='taken_user')
+        response = self.client.post(
+            self.api_register_url,
+            {'email': 'taken@example.com', 'username': 'other_user', 'password': 'newpass456'},
+        )
+        self.assertEqual(response.status_code, 400)
+
+
+class LogoutViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email='test@example.com', password='testpass123', username='test_user')
+
+    def setUp(self):
+        self.logout_url = reverse('logout')
+
+    def test_logout_view_authenticated_user(self):
+        self.client.force_login(self.user)
+        response = self.client.get(self.logout_url)
+        self.assertRedirects(response, reverse('login'))
+
+    def test_logout_view_unauthenticated(self):
+        response = self.client.get(self.logout_url)
+        self.assertEqual(response.status_code, 302)
+        self.assertIn(reverse('login'), response.url)
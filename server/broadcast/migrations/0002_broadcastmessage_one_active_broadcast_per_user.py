@@ -0,0 +1,19 @@
+# Generated by Django 5.1.6 on 2026-08-29 07:19
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('broadcast', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='broadcastmessage',
+            constraint=models.UniqueConstraint(condition=models.Q(('active', True)), fields=('user',), name='one_active_broadcast_per_user'),
+        ),
+    ]
@@ -7,17 +7,37 @@ class BroadcastMessage(models.Model):
     message = models.TextField()
     active = models.BooleanField(default=True)
 
+    class Meta:
+        constraints = [
+            # The database enforces the one-active-message invariant via
+            # a partial unique index, so save() can't race its way into
+            # two active rows.
+            models.UniqueConstraint(
+                fields=['user'],
+                condition=models.Q(active=True),
+                name='one_active_broadcast_per_user',
+            ),
+        ]
+
     def save(self, *args, **kwargs):
+        from dashboard.models import UserDetails
+
         if self.active:
             with transaction.atomic():
-
-                BroadcastMessage.objects.select_for_update().filter(
-                    user=self.user
-                ).update(active=False)
-                # Save this message as active
+                # Retire the others first: the partial index is checked
+                # immediately, so the active slot has to be free before
+                # this row takes it.
+                BroadcastMessage.objects.filter(
+                    user=self.user, active=True
+                ).exclude(pk=self.pk).update(active=False)
                 super().save(*args, **kwargs)
+                UserDetails.objects.filter(user=self.user).update(active_message=self)
         else:
-            super().save(*args, **kwargs)
+            with transaction.atomic():
+                super().save(*args, **kwargs)
+                UserDetails.objects.filter(
+                    user=self.user, active_message=self
+                ).update(active_message=None)
 
     def __str__(self):
         return f'{self.user.username}: {self.message[:20]}'
\ No newline at end of file
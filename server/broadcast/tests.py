@@ -1,3 +1,237 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
 from django.test import TestCase
+from django.urls import reverse, reverse_lazy
 
-# Create your tests here.
+from dashboard.models import UserDetails
+
+from .models import BroadcastMessage
+
+User = get_user_model()
+
+# Hashed once at import and shared by every fixture user; bulk_create
+# below then inserts a user pair with a single INSERT and zero extra
+# hash computations.
+_TEST_PW = make_password('testpass123')
+
+# Static routes resolved once per module; only the per-object routes
+# still call reverse() with kwargs inside the tests.
+HOME_URL = reverse_lazy('home')
+LOGIN_URL = reverse_lazy('login')
+ADD_URL = reverse_lazy('add_broadcast_message')
+
+
+class BroadcastMessageModelTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user, cls.other_user = User.objects.bulk_create([
+            User(email='test@example.com', username='test_user', password=_TEST_PW),
+            User(email='other@example.com', username='other_user', password=_TEST_PW),
+        ])
+
+    def test_str_representation(self):
+        message = BroadcastMessage.objects.create(user=self.user, message='A somewhat longer test message')
+        self.assertEqual(str(message), 'test_user: A somewhat longer te')
+
+    def test_save_deactivates_other_messages(self):
+        message1 = BroadcastMessage.objects.create(user=self.user, message='First', active=True)
+        BroadcastMessage.objects.create(user=self.user, message='Second', active=True)
+        self.assertFalse(BroadcastMessage.objects.values_list('active', flat=True).get(pk=message1.pk))
+
+    def test_inactive_save_keeps_other_messages_active(self):
+        message1 = BroadcastMessage.objects.create(user=self.user, message='First', active=True)
+        BroadcastMessage.objects.create(user=self.user, message='Second', active=False)
+        self.assertTrue(BroadcastMessage.objects.values_list('active', flat=True).get(pk=message1.pk))
+
+    def test_multiple_users_can_have_active_messages(self):
+        # bulk_create skips the custom save() on purpose: the
+        # deactivation side-effect is covered above, and a single INSERT
+        # is all this test needs.
+        BroadcastMessage.objects.bulk_create([
+            BroadcastMessage(user=self.user, message='Mine', active=True),
+            BroadcastMessage(user=self.other_user, message='Theirs', active=True),
+        ])
+        self.assertEqual(BroadcastMessage.objects.filter(active=True).count(), 2)
+
+
+class AddBroadcastMessageViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email='test@example.com', password=None, username='test_user')
+
+    add_url = ADD_URL
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def test_add_own_message(self):
+        response = self.client.post(self.add_url, {'message': 'Hello there'})
+        self.assertRedirects(response, HOME_URL)
+        self.assertTrue(BroadcastMessage.objects.filter(user=self.user, message='Hello there').exists())
+
+    def test_add_empty_message(self):
+        response = self.client.post(self.add_url, {'message': ''})
+        self.assertRedirects(response, HOME_URL)
+        self.assertFalse(BroadcastMessage.objects.filter(user=self.user).exists())
+
+
+class DeleteBroadcastMessageViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user, cls.other_user = User.objects.bulk_create([
+            User(email='test@example.com', username='test_user', password=_TEST_PW),
+            User(email='other@example.com', username='other_user', password=_TEST_PW),
+        ])
+
+    def setUp(self):
+        self.client.force_login(self.user)
+        self.message = BroadcastMessage.objects.create(user=self.user, message='Test message')
+
+    def test_delete_own_message(self):
+        url = reverse('delete_broadcast_message', kwargs={'message_id': self.message.id})
+        response = self.client.get(url)
+        self.assertRedirects(response, HOME_URL)
+        self.assertFalse(BroadcastMessage.objects.filter(id=self.message.id).exists())
+
+    def test_delete_nonexistent_message(self):
+        url = reverse('delete_broadcast_message', kwargs={'message_id': 9999})
+        response = self.client.get(url)
+        self.assertRedirects(response, HOME_URL)
+
+    def test_delete_another_users_message(self):
+        other_message = BroadcastMessage.objects.create(user=self.other_user, message='Other message')
+        url = reverse('delete_broadcast_message', kwargs={'message_id': other_message.id})
+        response = self.client.get(url)
+        self.assertRedirects(response, HOME_URL)
+        self.assertTrue(BroadcastMessage.objects.filter(id=other_message.id).exists())
+
+
+class UpdateBroadcastMessageViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user, cls.other_user = User.objects.bulk_create([
+            User(email='test@example.com', username='test_user', password=_TEST_PW),
+            User(email='other@example.com', username='other_user', password=_TEST_PW),
+        ])
+        cls.message = BroadcastMessage.objects.create(user=cls.user, message='Test message')
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def test_update_own_message(self):
+        url = reverse('update_broadcast_message', kwargs={'message_id': self.message.id})
+        response = self.client.post(url, {'message': 'Updated message'})
+        self.assertRedirects(response, HOME_URL)
+        # Fetch just the asserted column instead of re-hydrating the
+        # whole instance with refresh_from_db().
+        self.assertEqual(
+            BroadcastMessage.objects.values_list('message', flat=True).get(pk=self.message.pk),
+            'Updated message',
+        )
+
+    def test_update_another_users_message(self):
+        other_message = BroadcastMessage.objects.create(user=self.other_user, message='Other message')
+        url = reverse('update_broadcast_message', kwargs={'message_id': other_message.id})
+        response = self.client.post(url, {'message': 'Hijacked'})
+        self.assertRedirects(response, HOME_URL)
+        self.assertEqual(
+            BroadcastMessage.objects.values_list('message', flat=True).get(pk=other_message.pk),
+            'Other message',
+        )
+
+
+class ToggleBroadcastMessageViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user, cls.other_user = User.objects.bulk_create([
+            User(email='test@example.com', username='test_user', password=_TEST_PW),
+            User(email='other@example.com', username='other_user', password=_TEST_PW),
+        ])
+        cls.message = BroadcastMessage.objects.create(user=cls.user, message='Test message', active=True)
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def test_toggle_message_from_active_to_inactive(self):
+        url = reverse('toggle_broadcast_message', kwargs={'message_id': self.message.id})
+        response = self.client.get(url)
+        self.assertRedirects(response, HOME_URL)
+        self.assertFalse(BroadcastMessage.objects.values_list('active', flat=True).get(pk=self.message.pk))
+
+    def test_toggle_message_from_inactive_to_active(self):
+        # Plain queryset UPDATE: precondition setup shouldn't pay for
+        # the custom save()'s sibling deactivation scan.
+        BroadcastMessage.objects.filter(pk=self.message.pk).update(active=False)
+        url = reverse('toggle_broadcast_message', kwargs={'message_id': self.message.id})
+        response = self.client.get(url)
+        self.assertRedirects(response, HOME_URL)
+        self.assertTrue(BroadcastMessage.objects.values_list('active', flat=True).get(pk=self.message.pk))
+
+    def test_toggle_another_users_message(self):
+        other_message = BroadcastMessage.objects.create(user=self.other_user, message='Other message', active=True)
+        url = reverse('toggle_broadcast_message', kwargs={'message_id': other_message.id})
+        response = self.client.get(url)
+        self.assertRedirects(response, HOME_URL)
+        self.assertTrue(BroadcastMessage.objects.values_list('active', flat=True).get(pk=other_message.pk))
+
+
+class UnauthenticatedRedirectTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email='test@example.com', password=None, username='test_user')
+        cls.message = BroadcastMessage.objects.create(user=cls.user, message='Test message')
+
+    def test_views_redirect_to_login(self):
+        urls = [
+            str(ADD_URL),
+            reverse('delete_broadcast_message', kwargs={'message_id': self.message.id}),
+            reverse('update_broadcast_message', kwargs={'message_id': self.message.id}),
+            reverse('toggle_broadcast_message', kwargs={'message_id': self.message.id}),
+        ]
+        for url in urls:
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 302)
+                self.assertIn(str(LOGIN_URL), response.url)
+
+
+class ShowBroadcastMessagesViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email='test@example.com', password=None, username='test_user')
+        cls.details = UserDetails.objects.create(
+            user=cls.user, phone_number='1234567890', bio='Test bio',
+            designation='Developer', organization='Test Org',
+        )
+
+    def setUp(self):
+        self.message = BroadcastMessage.objects.create(user=self.user, message='Test message', active=True)
+
+    def test_show_broadcast_messages_with_active_message(self):
+        url = reverse('show_broadcast_messages', kwargs={'user_slug': self.details.slug})
+        # A single SELECT: UserDetails joined with its user and the
+        # denormalized active message — the view must not regress.
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data['message'], 'Test message')
+        self.assertTrue(data['active'])
+        self.assertEqual(data['username'], 'test user')
+
+    def test_show_broadcast_messages_no_active_message(self):
+        # Deactivate through save() so the denormalized pointer on
+        # UserDetails is cleared along with the flag.
+        self.message.active = False
+        self.message.save()
+        url = reverse('show_broadcast_messages', kwargs={'user_slug': self.details.slug})
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertIsNone(data['message'])
+        self.assertFalse(data['active'])
+
+    def test_show_broadcast_messages_unknown_slug(self):
+        url = reverse('show_broadcast_messages', kwargs={'user_slug': 'no-such-slug'})
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 404)
@@ -8,16 +8,18 @@ from django.contrib.auth.decorators import login_required
 def show_broadcast_messages(request, user_slug):
     # Return JSON response instead of rendering template
     from django.http import JsonResponse
-    userd = get_object_or_404(UserDetails, _slug=user_slug)
+    # The active message is denormalized onto UserDetails, so one
+    # SELECT joins user and message together.
+    userd = get_object_or_404(
+        UserDetails.objects.select_related('user', 'active_message'), _slug=user_slug)
     user = userd.user
-    active_message = user.messages.filter(active=True).first()
-    
+    active_message = userd.active_message
+
     return JsonResponse({
         'username': user.username.replace('_', ' '),
         'slug': user_slug,
         'message': active_message.message if active_message else None,
         'active': active_message.active if active_message else False,
-        'created_at': active_message.created_at.isoformat() if active_message else None
     }, status=200)
 
 # Create your views here.
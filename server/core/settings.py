@@ -177,6 +177,16 @@ STATIC_ROOT = BASE_DIR / "staticfiles"
 MEDIA_URL = '/media/'  # URL to access media files
 MEDIA_ROOT = BASE_DIR / 'media'  # Physical location on the server
 
+# Internal-location prefix for offloading media downloads to the front
+# server via X-Accel-Redirect (nginx) / X-Sendfile. Leave None to serve
+# files from Django. Example nginx block:
+#     location /protected_media/ { internal; alias /var/app/media/; }
+MEDIA_ACCEL_REDIRECT_PREFIX = None
+
+# Build QR images in a background thread so generate_qr redirects
+# immediately; set False to build inline (tests run eagerly).
+QR_BUILD_ASYNC = True
+
 AUTH_USER_MODEL = 'authApp.CustomUser'
 
 # Default primary key field type
@@ -0,0 +1,73 @@
+"""
+Settings overrides for running the test suite.
+
+Usage:
+    python manage.py test --settings=core.test_settings
+"""
+import tempfile
+
+from .settings import *  # noqa: F401,F403
+
+# Uploaded fixtures (profile images, QR PNGs) never touch the
+# filesystem: FileField writes land in a per-process dict and vanish
+# with the worker.
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.InMemoryStorage'},
+    'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+}
+
+# Kept for anything that still resolves MEDIA_ROOT directly.
+MEDIA_ROOT = tempfile.mkdtemp(prefix='sirkothay-test-media-')
+
+# Skip migration replay when building the test schema: with every app's
+# module mapped to None, Django issues CREATE TABLE straight from the
+# current models instead of running each migration in order.
+class DisableMigrations:
+    def __contains__(self, item):
+        return True
+
+    def __getitem__(self, item):
+        return None
+
+
+MIGRATION_MODULES = DisableMigrations()
+
+# Keep the whole test database in RAM; every INSERT/SELECT the tests
+# issue then skips the fsync/journal overhead of a file-backed engine.
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+}
+
+# Build QR images inline: assertions run right after the request, and
+# an executor thread would race the test transaction.
+QR_BUILD_ASYNC = False
+
+# Keep per-test state honest: the app caches flags like qr_exists:<pk>,
+# and primary keys repeat across rolled-back tests, so a real cache
+# backend would leak hits between tests.
+CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'},
+}
+
+# The tests never verify hashing strength, so skip the default PBKDF2
+# hasher (hundreds of thousands of SHA-256 iterations per create_user()
+# or login()) in favour of MD5, which is orders of magnitude cheaper.
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+# The views under test only need sessions, auth and the messages
+# framework; security headers, whitenoise, CORS and CSRF checks just
+# add per-request cost across hundreds of test client calls.
+MIDDLEWARE = [
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'django.contrib.messages.middleware.MessageMiddleware',
+]
+
+# Trim per-request overhead in view tests: no debug machinery, no
+# template debug context, no logging handlers.
+DEBUG = False
+TEMPLATES[0]['OPTIONS']['debug'] = False  # noqa: F405
+LOGGING = {'version': 1, 'disable_existing_loggers': True}
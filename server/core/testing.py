@@ -0,0 +1,67 @@
+"""
+Shared test fixtures.
+
+BaseAuthTestCase gives view tests a logged-in user without repeating
+the user/UserDetails/session boilerplate in every class.
+"""
+from io import BytesIO
+
+from PIL import Image
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.contrib.sessions.backends.db import SessionStore
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase
+
+from dashboard.models import UserDetails
+
+User = get_user_model()
+
+# Hashed once at import; every fixture user shares the digest instead
+# of re-running the hasher per create_user().
+_TEST_PW = make_password('testpass123')
+
+
+def session_key_for(user):
+    # Build an authenticated session directly; injecting its key as a
+    # cookie skips the whole authenticate()/login() dance per test.
+    session = SessionStore()
+    session['_auth_user_id'] = str(user.pk)
+    session['_auth_user_backend'] = 'django.contrib.auth.backends.ModelBackend'
+    session['_auth_user_hash'] = user.get_session_auth_hash()
+    session.save()
+    return session.session_key
+
+
+_image_bytes_cache = {}
+
+
+def uploaded_image(fmt='JPEG', color='red', name=None):
+    """Fresh SimpleUploadedFile over a payload encoded once per (fmt, color)."""
+    key = (fmt, color)
+    if key not in _image_bytes_cache:
+        buf = BytesIO()
+        Image.new('RGB', (10, 10), color).save(buf, format=fmt)
+        _image_bytes_cache[key] = buf.getvalue()
+    ext = 'jpg' if fmt == 'JPEG' else fmt.lower()
+    return SimpleUploadedFile(
+        name or f'test.{ext}', _image_bytes_cache[key], f'image/{fmt.lower()}')
+
+
+class BaseAuthTestCase(TestCase):
+    """View-test base: one user + details per class, session reused."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(
+            email='test@example.com', username='test_user', password=_TEST_PW)
+        cls.user_details = UserDetails.objects.create(
+            user=cls.user, phone_number='1234567890', bio='Test bio',
+            designation='Developer', organization='Test Org',
+        )
+        cls._session_key = session_key_for(cls.user)
+
+    def setUp(self):
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self._session_key
@@ -0,0 +1,43 @@
+import pytest
+
+from django.test import SimpleTestCase, TestCase, TransactionTestCase
+from django.urls import reverse
+
+import authApp.tests
+import broadcast.tests
+
+TEST_MODULES = [authApp.tests, broadcast.tests]
+
+
+# One parametrized function instead of a near-identical redirect test
+# per view; no `db` fixture, so no database is touched at all.
+@pytest.mark.parametrize('url_name', [
+    'home',
+    'profile',
+    'user_details_update',
+    'generate_qr',
+    'display_qr_svg',
+    'download_qr',
+    'download_qr_with_info',
+])
+def test_login_required(client, url_name):
+    response = client.get(reverse(url_name))
+    assert response.status_code == 302
+    assert reverse('login') in response.url
+
+
+class TestCaseBaseClassAuditTests(SimpleTestCase):
+    def test_no_bare_transaction_test_cases(self):
+        # TransactionTestCase truncates and re-inserts every table per
+        # test instead of rolling back a savepoint; nothing in this
+        # suite needs that, so flag any class that drops down to it.
+        for module in TEST_MODULES:
+            for name, obj in vars(module).items():
+                if not (isinstance(obj, type) and obj.__module__ == module.__name__):
+                    continue
+                if issubclass(obj, TransactionTestCase):
+                    self.assertTrue(
+                        issubclass(obj, TestCase),
+                        f'{module.__name__}.{name} should inherit django.test.TestCase, '
+                        'not TransactionTestCase',
+                    )
@@ -0,0 +1,32 @@
+# Generated by Django 5.1.6 on 2026-08-29 07:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_active_message(apps, schema_editor):
+    # Existing rows predate the denormalized pointer; populate it from
+    # each user's active message so live broadcast pages don't go blank.
+    UserDetails = apps.get_model('dashboard', 'UserDetails')
+    BroadcastMessage = apps.get_model('broadcast', 'BroadcastMessage')
+    for message in BroadcastMessage.objects.filter(active=True).iterator():
+        UserDetails.objects.filter(user_id=message.user_id).update(
+            active_message=message.pk)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('broadcast', '0002_broadcastmessage_one_active_broadcast_per_user'),
+        ('dashboard', '0002_alter_userdetails_user'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userdetails',
+            name='active_message',
+            field=models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='broadcast.broadcastmessage'),
+        ),
+        migrations.RunPython(
+            backfill_active_message, migrations.RunPython.noop),
+    ]
@@ -11,6 +11,13 @@ class UserDetails(models.Model):
     designation = models.CharField(max_length=150)
     organization = models.CharField(max_length=150)
     _slug = models.SlugField(max_length=100, unique=True, blank=True, null=True)
+    # Denormalized pointer maintained by BroadcastMessage.save(): the
+    # public broadcast page reads the active message without scanning
+    # the user's messages for active=True.
+    active_message = models.OneToOneField(
+        'broadcast.BroadcastMessage', on_delete=models.SET_NULL,
+        null=True, blank=True, related_name='+',
+    )
     
     @property
     def slug(self):
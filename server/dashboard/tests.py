@@ -1,3 +1,116 @@
+from django.contrib.auth import get_user_model
 from django.test import TestCase
+from django.urls import reverse
 
-# Create your tests here.
+from core.testing import BaseAuthTestCase, uploaded_image
+
+from .models import UserDetails
+
+User = get_user_model()
+
+
+class UserDetailsModelTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email='test@example.com', password=None, username='test_user')
+        cls.details = UserDetails.objects.create(
+            user=cls.user, phone_number='1234567890', bio='Test bio',
+            designation='Developer', organization='Test Org',
+        )
+
+    def test_str_representation(self):
+        self.assertEqual(str(self.details), 'Developer at Test Org')
+
+    def test_slug_generated_on_save(self):
+        self.assertTrue(self.details._slug)
+        self.assertEqual(self.details.slug, self.details._slug)
+
+    def test_slug_unique(self):
+        # bulk_create skips create_user's hashing/signal overhead; the
+        # test only needs a second row to compare slugs against.
+        user2, = User.objects.bulk_create(
+            [User(email='second@example.com', username='second_user')])
+        details2 = UserDetails.objects.create(
+            user=user2, phone_number='0987654321', bio='Other bio',
+            designation='Designer', organization='Other Org',
+        )
+        self.assertNotEqual(self.details._slug, details2._slug)
+
+    def test_get_image_url_without_image(self):
+        self.assertIsNone(self.details.get_image_url)
+
+    def test_get_image_url_with_image(self):
+        self.details.profile_image = uploaded_image(name='profile.jpg')
+        self.details.save()
+        self.assertIn('profile_images/', self.details.get_image_url)
+
+
+class HomeViewTests(BaseAuthTestCase):
+    def setUp(self):
+        super().setUp()
+        self.home_url = reverse('home')
+
+    def test_home_view_authenticated(self):
+        # Session fetch + user fetch and nothing else; the endpoint map
+        # is static, so any extra query is a regression.
+        with self.assertNumQueries(2):
+            response = self.client.get(self.home_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('api_endpoints', response.json())
+
+
+class ProfileViewTests(BaseAuthTestCase):
+    def setUp(self):
+        super().setUp()
+        self.profile_url = reverse('profile')
+
+    def test_profile_view_authenticated(self):
+        with self.assertNumQueries(2):
+            response = self.client.get(self.profile_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['api_endpoint'], '/api/auth/users/profile/')
+
+
+class UserDetailViewTests(BaseAuthTestCase):
+    def setUp(self):
+        super().setUp()
+        self.update_url = reverse('user_details_update')
+
+    def test_update_user_details_post(self):
+        response = self.client.post(self.update_url, {
+            'bio': 'New bio',
+            'organization': 'New Org',
+            'designation': 'Lead Developer',
+            'phone_number': '5555555555',
+        })
+        self.assertRedirects(response, reverse('home'))
+        # Refetch only the asserted columns; skips marshaling the
+        # FileField and slug machinery for fields nobody reads.
+        details = UserDetails.objects.only(
+            'bio', 'organization', 'designation', 'phone_number',
+        ).get(user=self.user)
+        self.assertEqual(details.bio, 'New bio')
+        self.assertEqual(details.organization, 'New Org')
+        self.assertEqual(details.designation, 'Lead Developer')
+        self.assertEqual(details.phone_number, '5555555555')
+
+    def test_partial_update(self):
+        response = self.client.post(self.update_url, {'bio': 'Only the bio changed'})
+        self.assertRedirects(response, reverse('home'))
+        details = UserDetails.objects.only(
+            'bio', 'phone_number', 'designation',
+        ).get(user=self.user)
+        self.assertEqual(details.bio, 'Only the bio changed')
+        self.assertEqual(details.phone_number, '1234567890')
+        self.assertEqual(details.designation, 'Developer')
+
+    def test_update_with_profile_image(self):
+        uploaded = uploaded_image(name='profile.jpg')
+        response = self.client.post(self.update_url, {'bio': 'With image', 'profile_image': uploaded})
+        self.assertRedirects(response, reverse('home'))
+        details = UserDetails.objects.get(user=self.user)
+        self.assertTrue(details.profile_image)
+
+    def test_update_user_details_get_redirects(self):
+        response = self.client.get(self.update_url)
+        self.assertRedirects(response, reverse('home'))
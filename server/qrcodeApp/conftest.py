@@ -0,0 +1,38 @@
+from types import SimpleNamespace
+
+import pytest
+
+from django.contrib.auth import get_user_model
+from django.contrib.sessions.models import Session
+from django.test import Client
+from django.urls import reverse
+
+from dashboard.models import UserDetails
+
+from .models import QRCode
+
+
+@pytest.fixture(scope='module')
+def qr_env(django_db_setup, django_db_blocker):
+    # One committed user + details + generated QR shared by the whole
+    # workflow module, instead of rebuilding the triple per test.
+    # Module-scoped fixtures don't get a rollback, so teardown removes
+    # exactly what was created.
+    with django_db_blocker.unblock():
+        user = get_user_model().objects.create_user(
+            email='workflow@example.com', password=None, username='workflow_user')
+        details = UserDetails.objects.create(
+            user=user, phone_number='1234567890', bio='Test bio',
+            designation='Developer', organization='Test Org',
+        )
+        client = Client()
+        client.force_login(user)
+        client.get(reverse('generate_qr'))
+        qr_code = QRCode.objects.get(user=user)
+        session_key = client.session.session_key
+    yield SimpleNamespace(user=user, details=details, client=client, qr_code=qr_code)
+    with django_db_blocker.unblock():
+        QRCode.objects.filter(user=user).delete()
+        UserDetails.objects.filter(user=user).delete()
+        Session.objects.filter(session_key=session_key).delete()
+        user.delete()
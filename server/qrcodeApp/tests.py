@@ -1,3 +1,184 @@
+from io import BytesIO
+from unittest import mock
+
+import pytest
+
+from django.contrib.auth import get_user_model
 from django.test import TestCase
+from django.urls import reverse
+
+from core.testing import uploaded_image
+from dashboard.models import UserDetails
+
+from .models import QRCode
+
+User = get_user_model()
+
+
+class QRCodeModelTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email='test@example.com', password=None, username='test_user')
+
+    def test_str_representation(self):
+        qr_code = QRCode.objects.create(user=self.user)
+        self.assertEqual(str(qr_code), 'QR Code for test_user')
+
+    def test_get_qr_url_without_image(self):
+        qr_code = QRCode.objects.create(user=self.user)
+        self.assertIsNone(qr_code.get_qr_url)
+
+    def test_get_qr_url_with_image(self):
+        qr_code = QRCode.objects.create(
+            user=self.user, image=uploaded_image('PNG', 'white', name='qr.png'))
+        self.assertIn('qr_codes/', qr_code.get_qr_url)
+
+
+class GenerateQRCodeViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email='test@example.com', password='testpass123', username='test_user')
+        cls.details = UserDetails.objects.create(
+            user=cls.user, phone_number='1234567890', bio='Test bio',
+            designation='Developer', organization='Test Org',
+        )
+
+    def setUp(self):
+        self.client.force_login(self.user)
+        self.generate_url = reverse('generate_qr')
+
+    def test_generate_creates_qr_code(self):
+        response = self.client.get(self.generate_url)
+        self.assertRedirects(response, reverse('home'))
+        qr_code = QRCode.objects.get(user=self.user)
+        self.assertTrue(qr_code.image)
+
+    def test_generate_twice_keeps_single_qr_code(self):
+        self.client.get(self.generate_url)
+        response = self.client.get(self.generate_url)
+        self.assertRedirects(response, reverse('home'))
+        self.assertEqual(QRCode.objects.filter(user=self.user).count(), 1)
+
+    def test_failed_build_leaves_no_placeholder(self):
+        # A build failure must not leave the imageless row behind, or the
+        # exists short-circuit would block the user from ever retrying.
+        with mock.patch('qrcodeApp.views._qr_png_bytes',
+                        side_effect=OSError('storage down')):
+            with self.assertRaises(OSError):
+                self.client.get(self.generate_url)
+        self.assertFalse(QRCode.objects.filter(user=self.user).exists())
+        # The next attempt succeeds from scratch.
+        self.client.get(self.generate_url)
+        self.assertTrue(QRCode.objects.get(user=self.user).image)
+
+
+class DisplayQRSvgViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email='test@example.com', password='testpass123', username='test_user')
+        cls.details = UserDetails.objects.create(
+            user=cls.user, phone_number='1234567890', bio='Test bio',
+            designation='Developer', organization='Test Org',
+        )
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def test_display_qr_svg(self):
+        response = self.client.get(reverse('display_qr_svg'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'image/svg+xml')
+        self.assertIn(b'<svg', response.content)
+
+
+class DownloadQRCodeViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email='test@example.com', password='testpass123', username='test_user')
+
+    def setUp(self):
+        self.client.force_login(self.user)
+        self.download_url = reverse('download_qr')
+        self.qr_code = QRCode.objects.create(
+            user=self.user, image=uploaded_image('PNG', 'white', name='qr.png'))
+
+    def test_download_qr_code_authenticated(self):
+        response = self.client.get(self.download_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('attachment', response['Content-Disposition'])
+
+    def test_download_qr_code_without_qr_404(self):
+        self.qr_code.delete()
+        response = self.client.get(self.download_url)
+        self.assertEqual(response.status_code, 404)
+
+
+class DownloadQRWithInfoViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email='test@example.com', password='testpass123', username='test_user')
+        cls.details = UserDetails.objects.create(
+            user=cls.user, phone_number='1234567890', bio='Test bio',
+            designation='Developer', organization='Test Org',
+        )
+
+    def setUp(self):
+        self.client.force_login(self.user)
+        self.download_url = reverse('download_qr_with_info')
+        self.qr_code = QRCode.objects.create(
+            user=self.user, image=uploaded_image('PNG', 'white', name='qr.png'))
+
+    # These tests only assert status and headers, so the reportlab
+    # render — the slowest thing in this module — is stubbed out. The
+    # real render is covered by the slow-marked workflow test below.
+
+    def test_download_qr_with_info_authenticated(self):
+        with mock.patch('qrcodeApp.views._render_pdf',
+                        return_value=BytesIO(b'%PDF-1.4\n')) as render:
+            response = self.client.get(self.download_url)
+        render.assert_called_once()
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('info_with_qr.pdf', response['Content-Disposition'])
+
+    def test_download_qr_with_info_without_profile_image(self):
+        # details has no profile image by default; the view should still
+        # respond from the remaining info.
+        with mock.patch('qrcodeApp.views._render_pdf',
+                        return_value=BytesIO(b'%PDF-1.4\n')):
+            response = self.client.get(self.download_url)
+        self.assertEqual(response.status_code, 200)
+
+
+# The end-to-end workflow runs against the module-scoped qr_env from
+# conftest.py: one committed user/details/QR triple shared by every
+# step instead of a rebuild per test.
+
+@pytest.mark.django_db
+def test_workflow_generate_is_one_time(qr_env):
+    response = qr_env.client.get(reverse('generate_qr'))
+    assert response.status_code == 302
+    assert QRCode.objects.filter(user=qr_env.user).count() == 1
+
+
+@pytest.mark.django_db
+def test_workflow_home_sees_qr(qr_env):
+    response = qr_env.client.get(reverse('home'))
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_workflow_download_qr(qr_env, django_assert_num_queries):
+    # Session + user + the QRCode row; pins the view's query budget.
+    with django_assert_num_queries(3):
+        response = qr_env.client.get(reverse('download_qr'))
+    assert response.status_code == 200
+    assert 'attachment' in response['Content-Disposition']
+
 
-# Create your tests here.
+@pytest.mark.slow
+@pytest.mark.django_db
+def test_workflow_download_qr_info(qr_env, django_assert_num_queries):
+    with django_assert_num_queries(4):
+        response = qr_env.client.get(reverse('download_qr_with_info'))
+    assert response.status_code == 200
+    assert 'info_with_qr.pdf' in response['Content-Disposition']
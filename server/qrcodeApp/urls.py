@@ -3,6 +3,7 @@ from . import views
 
 urlpatterns = [
     path('generate-qr-code-with-logo/', views.generate_qr_code_with_logo, name='generate_qr'),
+    path('display-qr-svg/', views.display_qr_svg, name='display_qr_svg'),
     path('download-qr-code/', views.download_qr_code, name='download_qr'),
     path('download-qr-with-info/', views.download_qr_with_info, name='download_qr_with_info'),
 ]
\ No newline at end of file
@@ -1,18 +1,33 @@
+import functools
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import qrcode
+import qrcode.image.pure
+import qrcode.image.svg
 from PIL import Image
+
+try:  # libvips' threaded encoder beats PIL's zlib path when available
+    import pyvips
+except ImportError:
+    pyvips = None
 from django.contrib import messages
 from django.shortcuts import render, redirect
-from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
 from django.contrib.staticfiles import finders
 from io import BytesIO
 from django.conf import settings
 from django.contrib.auth.decorators import login_required
+from django.core.cache import cache
+from django.db import connections
 from .models import QRCode
 from django.urls import reverse
 
-from django.http import FileResponse, Http404
+from django.http import FileResponse, Http404, HttpResponse, HttpResponseNotFound
 from django.shortcuts import get_object_or_404
-import os
 
 from dashboard.models import UserDetails
 
@@ -22,20 +37,36 @@ from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image as RL
 from reportlab.lib import colors
 from reportlab.lib.units import inch
 
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=1)
+def _show_path_fmt():
+    # The broadcast-page pattern never changes, so walk the resolver
+    # once; lru_cache defers the reverse() until the URLconf is loaded.
+    return reverse('show_broadcast_messages', kwargs={'user_slug': '__SLUG__'})
+
+
+@functools.lru_cache(maxsize=1)
+def _logo():
+    # The logo is a static asset: find, decode, convert and resize it
+    # once per process instead of on every render. lru_cache keeps the
+    # lookup lazy so Django's autoreload picks up a replaced file.
+    logo_path = finders.find('images/logo.png')
+    if not logo_path:
+        return None
+    # BILINEAR is indistinguishable from LANCZOS at 90x60 over a blocky
+    # QR background and runs a much shorter kernel. Greyscale copy plus
+    # alpha mask, so the composite never has to leave single-channel.
+    logo = Image.open(logo_path).convert("RGBA").resize((90, 60), Image.BILINEAR)
+    return logo.convert('L'), logo.getchannel('A')
 
-@login_required(login_url='login')
-def generate_qr_code_with_logo(request):
-    slug = get_object_or_404(UserDetails, user=request.user).slug
-    
-    # Check if the user already has a QR code
-    if QRCode.objects.filter(user=request.user).exists():
-        messages.info(request, "You already have your one-time QR code.")
-        return redirect(reverse('home'))
-    
-    # Build the URL using the URL name
-    url_to_encode = request.build_absolute_uri(reverse('show_broadcast_messages', kwargs={'user_slug': slug}))
 
-    # Generate the QR code
+@functools.lru_cache(maxsize=4096)
+def _make_qr(url_to_encode):
+    # add_data/make run Reed-Solomon encoding and mask selection in
+    # pure Python; the result is deterministic per URL, so cache the
+    # finished (read-only from here on) QRCode per encoded URL.
     qr = qrcode.QRCode(
         version=1,  # controls the size of the QR Code
         error_correction=qrcode.constants.ERROR_CORRECT_H,  # High error correction for logo insertion
@@ -44,76 +75,194 @@ def generate_qr_code_with_logo(request):
     )
     qr.add_data(url_to_encode)
     qr.make(fit=True)
+    return qr
 
-    # Create an image from the QR code
-    img = qr.make_image(fill='black', back_color='white').convert("RGBA")  # Convert to RGBA for transparency support
 
-    # Open the logo image
-    logo_path = finders.find('images/logo.png')
-    if logo_path:
-        logo = Image.open(logo_path).convert("RGBA")  # Ensure the logo has an alpha channel
+def _render_qr_png(url_to_encode):
+    """Render the QR-plus-logo composite and return it as PNG bytes."""
+    qr = _make_qr(url_to_encode)
 
-        # Calculate the size of the logo and resize it
-        qr_width, qr_height = img.size
-        logo = logo.resize((90, 60), Image.LANCZOS)
+    logo = _logo()
+    if logo is None:
+        # No logo to composite, so skip PIL entirely: PyPNG writes a
+        # 1-bit greyscale PNG straight from the module matrix.
+        img_buffer = BytesIO()
+        qr.make_image(image_factory=qrcode.image.pure.PyPNGImage).save(img_buffer)
+        return img_buffer.getvalue()
 
-        # Create a transparent layer the same size as the QR code
-        overlay = Image.new("RGBA", img.size, (255, 255, 255, 0))
-        logo_position = ((qr_width - 90) // 2, (qr_height - 60) // 2)
+    # Build the bitmap straight from the module matrix: np.kron upscales
+    # every module to its 10x10 box in one vectorized pass instead of
+    # qrcode's per-module PIL draw calls. get_matrix() already includes
+    # the quiet-zone border, so the output matches make_image() exactly.
+    matrix = np.array(qr.get_matrix(), dtype=np.uint8)
+    bitmap = np.kron(1 - matrix, np.ones((10, 10), dtype=np.uint8)) * 255
+    # Stay in 'L': a single channel is a quarter of the RGBA memory and
+    # gives the PNG encoder a quarter of the bytes to deflate.
+    img = Image.fromarray(bitmap, 'L')
 
-        # Paste the logo onto the overlay
-        overlay.paste(logo, logo_position, logo)
+    # Overlay the pre-baked logo. Masked paste straight onto the QR
+    # image: only the logo's bounding box gets blended, instead of
+    # alpha_composite walking every pixel of a full-size, mostly
+    # transparent overlay.
+    logo_l, logo_mask = logo
+    qr_width, qr_height = img.size
+    logo_position = ((qr_width - 90) // 2, (qr_height - 60) // 2)
+    img.paste(logo_l, logo_position, logo_mask)
 
-        # Merge QR code and logo overlay
-        img = Image.alpha_composite(img, overlay)
+    # Encode at the lowest compression level: PNG is lossless at every
+    # zlib level, so this keeps the encode fast for a marginally bigger
+    # file that's stored once.
+    if pyvips is not None:
+        vimg = pyvips.Image.new_from_memory(
+            np.asarray(img).tobytes(), img.width, img.height, 1, 'uchar')
+        return vimg.write_to_buffer('.png[compression=1,filter=none]')
 
-    # Save the image to a BytesIO buffer
     img_buffer = BytesIO()
-    img.save(img_buffer, format='PNG')
-    img_buffer.seek(0)
-
-    # Create a SimpleUploadedFile to save the image
-    qr_image = SimpleUploadedFile(
-        name=f"qr_code_with_logo_slug_{slug}.png",
-        content=img_buffer.read(),
-        content_type='image/png'
-    )
+    img.save(img_buffer, format='PNG', compress_level=1, optimize=False)
+    return img_buffer.getvalue()
 
-    # Create or update the QRCode object in the database
-    qr_code, created = QRCode.objects.get_or_create(user=request.user)
-    qr_code.image.save(qr_image.name, qr_image)
-    qr_code.save()
+
+def _qr_png_bytes(url_to_encode):
+    # The rendered PNG is deterministic from the encoded URL, so cache
+    # it in storage keyed by a digest of the URL; repeat builds become a
+    # single read instead of the QR matrix + composite + encode work.
+    key = hashlib.blake2b(url_to_encode.encode(), digest_size=16).hexdigest()
+    cache_name = f"qr_cache/{key}.png"
+    if default_storage.exists(cache_name):
+        with default_storage.open(cache_name, 'rb') as cached:
+            return cached.read()
+    png = _render_qr_png(url_to_encode)
+    default_storage.save(cache_name, ContentFile(png))
+    return png
+
+
+# Render + storage write run off-request in this executor when
+# QR_BUILD_ASYNC is on; one worker is plenty for a one-time-per-user job.
+_QR_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix='qr-build')
+
+
+def _build_qr_image(qr_pk, user_pk, slug, url_to_encode):
+    try:
+        png = _qr_png_bytes(url_to_encode)
+        qr_code = QRCode.objects.get(pk=qr_pk)
+        # FieldFile.save persists the row itself (save=True by default),
+        # so no separate model save() is needed.
+        qr_code.image.save(
+            f"qr_code_with_logo_slug_{slug}.png",
+            ContentFile(png),
+        )
+    except Exception:
+        # Nobody checks the Future, so a swallowed exception here would
+        # leave the imageless row and the 24h exists flag behind and
+        # every later generate would short-circuit on them. Log, roll
+        # both back, and let the next generate retry from scratch.
+        logger.exception("QR build failed for user %s", user_pk)
+        QRCode.objects.filter(pk=qr_pk, image='').delete()
+        cache.delete(f'qr_exists:{user_pk}')
+        raise
+    finally:
+        # Executor threads would otherwise pin their DB connection open.
+        connections.close_all()
+
+
+@login_required(login_url='login')
+def generate_qr_code_with_logo(request):
+    slug = get_object_or_404(UserDetails, user=request.user).slug
     
-    messages.success(request, "QR Code with logo generated successfully!")
+    # Check if the user already has a QR code. The flag only flips once
+    # (generation is one-time), so cache it and skip the EXISTS query on
+    # repeat hits.
+    exists_key = f'qr_exists:{request.user.pk}'
+    if cache.get_or_set(
+            exists_key,
+            lambda: QRCode.objects.filter(user=request.user).exists(),
+            86400):
+        messages.info(request, "You already have your one-time QR code.")
+        return redirect(reverse('home'))
+    
+    # Build the absolute URL from the memoized path format; skips the
+    # per-request resolver walk and urljoin in build_absolute_uri.
+    path = _show_path_fmt().replace('__SLUG__', slug)
+    url_to_encode = f'{request.scheme}://{request.get_host()}{path}'
+
+    # Create the QRCode row up front; the image lands on it when the
+    # build finishes.
+    qr_code, created = QRCode.objects.get_or_create(user=request.user)
+    cache.set(exists_key, True, 86400)
+
+    if settings.QR_BUILD_ASYNC:
+        # Hand the render and storage write to the executor so the
+        # redirect returns immediately; download_qr answers Retry-After
+        # until the image lands.
+        _QR_EXECUTOR.submit(
+            _build_qr_image, qr_code.pk, request.user.pk, slug, url_to_encode)
+        messages.success(request, "Your QR Code is being generated!")
+    else:
+        _build_qr_image(qr_code.pk, request.user.pk, slug, url_to_encode)
+        messages.success(request, "QR Code with logo generated successfully!")
 
     return redirect(reverse('home'))
 
+@login_required(login_url='login')
+def display_qr_svg(request):
+    # For pure browser display SVG beats the raster pipeline: the QR
+    # becomes one path element — no compositing, no deflate — and scales
+    # losslessly. The stored PNG stays the download/PDF format.
+    slug = get_object_or_404(UserDetails, user=request.user).slug
+    path = _show_path_fmt().replace('__SLUG__', slug)
+    url_to_encode = f'{request.scheme}://{request.get_host()}{path}'
+
+    svg_buffer = BytesIO()
+    _make_qr(url_to_encode).make_image(
+        image_factory=qrcode.image.svg.SvgPathImage).save(svg_buffer)
+    return HttpResponse(svg_buffer.getvalue(), content_type='image/svg+xml')
+
+
 @login_required(login_url='login')
 def download_qr_code(request):
     # Get the QR code for the logged-in user or return 404 if not found
     qr_code = get_object_or_404(QRCode, user=request.user)
 
-    # Get the file path
-    qr_code_path = qr_code.image.path
+    # Ensure the file exists before serving; go through the storage API
+    # so any configured backend works, not just the filesystem. With the
+    # async build the row can briefly exist before its image does, so
+    # tell clients when to come back.
+    if not qr_code.image or not qr_code.image.storage.exists(qr_code.image.name):
+        response = HttpResponseNotFound("QR code is not ready yet.")
+        response['Retry-After'] = '2'
+        return response
 
-    # Ensure the file exists before serving
-    if not os.path.exists(qr_code_path):
-        raise Http404("QR code file not found.")
+    # With a front server configured, hand the file path over via
+    # X-Accel-Redirect so the worker is freed immediately and nginx
+    # streams the bytes itself.
+    accel_prefix = settings.MEDIA_ACCEL_REDIRECT_PREFIX
+    if accel_prefix:
+        response = HttpResponse(content_type='image/png')
+        response['X-Accel-Redirect'] = accel_prefix + qr_code.image.name
+        response['Content-Disposition'] = 'attachment; filename="qr_code.png"'
+        return response
 
-    # Open file and set headers to force download
-    response = FileResponse(open(qr_code_path, 'rb'))
-    response['Content-Type'] = 'application/octet-stream'  # Ensures it's always downloaded
-    response['Content-Disposition'] = 'attachment; filename="qr_code.png"'
+    # QR PNGs are a few KB, so read them in one go and answer with a
+    # plain HttpResponse; the streaming state machine only pays off on
+    # files big enough to need chunking.
+    if qr_code.image.size < 32768:
+        with qr_code.image.open('rb') as image_file:
+            data = image_file.read()
+        response = HttpResponse(data, content_type='image/png')
+        response['Content-Disposition'] = 'attachment; filename="qr_code.png"'
+        return response
 
-    return response
-
-@login_required(login_url='login')
-def download_qr_with_info(request):
-    # Get user details
-    user_details = get_object_or_404(UserDetails, user=request.user)
-    qr_code = get_object_or_404(QRCode, user=request.user)
+    # FileResponse's attachment path sets the headers itself and keeps
+    # the wsgi.file_wrapper/sendfile fast path available to the server.
+    return FileResponse(
+        qr_code.image.open('rb'),
+        as_attachment=True,
+        filename='qr_code.png',
+        content_type='image/png',
+    )
 
-    # Create PDF buffer
+def _render_pdf(user, user_details, qr_code):
+    """Build the info-plus-QR PDF and return it as a BytesIO buffer."""
     buffer = BytesIO()
     doc = SimpleDocTemplate(buffer, pagesize=letter)
     styles = getSampleStyleSheet()
@@ -124,17 +273,18 @@ def download_qr_with_info(request):
     story.append(title)
     story.append(Spacer(1, 12))
 
-    # Load images
-    profile_img_path = user_details.profile_image.path if user_details.profile_image and os.path.exists(user_details.profile_image.path) else None
-    qr_img_path = qr_code.image.path
+    # Load images through the storage API (ImageReader accepts the
+    # file-like objects FieldFile.open returns)
+    profile_image = user_details.profile_image
+    has_profile_image = bool(profile_image) and profile_image.storage.exists(profile_image.name)
 
     # Left side: profile image and info
     left_flowables = []
-    if profile_img_path:
-        left_flowables.append(RLImage(profile_img_path, width=2*inch, height=2*inch))
+    if has_profile_image:
+        left_flowables.append(RLImage(profile_image.open('rb'), width=2*inch, height=2*inch))
         left_flowables.append(Spacer(1, 12))
-    info_text = f"<b>Name:</b> {request.user.get_full_name() or request.user.username}<br/>" \
-                f"<b>Email:</b> {request.user.email}<br/>" \
+    info_text = f"<b>Name:</b> {user.get_full_name() or user.username}<br/>" \
+                f"<b>Email:</b> {user.email}<br/>" \
                 f"<b>Phone:</b> {user_details.phone_number}<br/>" \
                 f"<b>Organization:</b> {user_details.organization}<br/>" \
                 f"<b>Designation:</b> {user_details.designation}"
@@ -142,7 +292,7 @@ def download_qr_with_info(request):
 
     # Right side: QR code
     right_flowables = []
-    right_flowables.append(RLImage(qr_img_path, width=3.25*inch, height=3.25*inch))
+    right_flowables.append(RLImage(qr_code.image.open('rb'), width=3.25*inch, height=3.25*inch))
     right_flowables.append(Spacer(1, 12))
     # Create table
     data = [
@@ -160,6 +310,16 @@ def download_qr_with_info(request):
 
     doc.build(story)
     buffer.seek(0)
+    return buffer
+
+
+@login_required(login_url='login')
+def download_qr_with_info(request):
+    # Get user details
+    user_details = get_object_or_404(UserDetails, user=request.user)
+    qr_code = get_object_or_404(QRCode, user=request.user)
+
+    buffer = _render_pdf(request.user, user_details, qr_code)
 
     response = FileResponse(buffer, as_attachment=True, filename='info_with_qr.pdf')
     return response